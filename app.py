@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
 import io
 import os
+import re
 import time
-from pathlib import Path
-from typing import Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 
 import pandas as pd
+import requests
 import streamlit as st
 
-from trackdechets_client import TrackdechetsClient, TrackdechetsError
+from trackdechets_client import CompanyAccess, TrackdechetsClient, TrackdechetsError
 
 
 BSD_TYPES = [
@@ -27,7 +30,7 @@ REGISTRY_TYPES = {
     "Registre entrant (réception)": "INCOMING",
 }
 
-BSD_TYPE_COLUMN_CANDIDATES = [
+BSD_TYPE_COLUMN_CANDIDATES = (
     "bsdtype",
     "bsd_type",
     "type de bordereau",
@@ -35,17 +38,74 @@ BSD_TYPE_COLUMN_CANDIDATES = [
     "type bordereau",
     "type de déchet",
     "type",
-]
+)
+
+DATE_COLUMN_CANDIDATES = (
+    "date",
+    "date de creation",
+    "date de reception",
+    "date de prise en charge",
+    "date d'envoi",
+    "date d'emission",
+    "createdat",
+    "date creation",
+)
 
 DEFAULT_START_DATE = dt.date(2001, 1, 1)
-
-
-def default_date_range() -> tuple[dt.date, dt.date]:
-    today = dt.date.today()
-    start = today.replace(day=1)
-    return start, today
-
-
+DEFAULT_START_ISO = dt.datetime.combine(DEFAULT_START_DATE, dt.time(0, 0, 0)).isoformat() + "Z"
+
+_SIRET_RE = re.compile(r"\d{14}")
+
+APP_CSS = """
+<style>
+  @import url('https://fonts.googleapis.com/css2?family=Source+Serif+4:wght@400;600&family=Source+Sans+3:wght@400;600&display=swap');
+  html, body, [class*="css"]  {
+    font-family: "Source Sans 3", "Segoe UI", "Arial", sans-serif;
+  }
+  h1, h2, h3, h4 {
+    font-family: "Source Serif 4", "Georgia", serif;
+  }
+  [data-testid="stHeader"], [data-testid="stToolbar"], footer {
+    visibility: hidden;
+    height: 0;
+  }
+  .block-container {
+    padding-top: 2.5rem;
+    padding-bottom: 2rem;
+  }
+  .hero {
+    background: linear-gradient(115deg, #f5f0ea 0%, #f8faf4 100%);
+    border: 1px solid #e6dfd7;
+    border-radius: 16px;
+    padding: 1.5rem 1.75rem;
+    margin-bottom: 1.5rem;
+  }
+  .hero small {
+    color: #6b5f55;
+    font-weight: 600;
+    letter-spacing: 0.08em;
+    text-transform: uppercase;
+  }
+  .hero h1 {
+    margin-top: 0.5rem;
+    margin-bottom: 0.4rem;
+  }
+  .hero p {
+    margin: 0;
+    color: #4f463f;
+  }
+  .status-card {
+    background: #ffffff;
+    border-radius: 12px;
+    border: 1px solid #ece6df;
+    padding: 1rem 1.2rem;
+    margin-top: 0.8rem;
+  }
+</style>
+"""
+
+
+@functools.lru_cache(maxsize=4)
 def to_iso_datetime(date_value: dt.date, end_of_day: bool) -> str:
     if end_of_day:
         dt_value = dt.datetime.combine(date_value, dt.time(23, 59, 59))
@@ -54,23 +114,195 @@ def to_iso_datetime(date_value: dt.date, end_of_day: bool) -> str:
     return dt_value.isoformat() + "Z"
 
 
-def normalize_header(header: str) -> str:
-    return header.strip().lower()
+@functools.lru_cache(maxsize=32)
+def _normalize(columns: Tuple[str, ...]) -> Dict[str, str]:
+    index = pd.Index(columns)
+    return dict(zip(index.str.strip().str.lower(), index))
+
+
+def _find_column(columns: Iterable[str], candidates: Iterable[str]) -> Optional[str]:
+    normalized = _normalize(tuple(columns))
+    return next((normalized[c] for c in candidates if c in normalized), None)
 
 
 def find_bsd_type_column(columns: Iterable[str]) -> Optional[str]:
-    normalized = {normalize_header(col): col for col in columns}
-    for candidate in BSD_TYPE_COLUMN_CANDIDATES:
-        if candidate in normalized:
-            return normalized[candidate]
-    return None
+    return _find_column(columns, BSD_TYPE_COLUMN_CANDIDATES)
+
+
+def registry_dates(df: Optional[pd.DataFrame]) -> Optional[pd.Series]:
+    if df is None or df.empty:
+        return None
+    date_col = _find_column(df.columns, DATE_COLUMN_CANDIDATES)
+    if not date_col:
+        return None
+    dates = pd.to_datetime(df[date_col], errors="coerce")
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates.dt.normalize()
+
+
+def filter_by_date(
+    df: pd.DataFrame,
+    dates: Optional[pd.Series],
+    start_date: dt.date,
+    end_date: dt.date,
+    full_start: dt.date,
+    full_end: dt.date,
+) -> pd.DataFrame:
+    if start_date <= full_start and end_date >= full_end:
+        return df
+    if df is None or dates is None:
+        return df
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    if dates.is_monotonic_increasing:
+        lo = dates.searchsorted(start, side="left")
+        hi = dates.searchsorted(end, side="right")
+        return df.iloc[lo:hi]
+    mask = (dates >= start) & (dates <= end)
+    return df.loc[mask]
 
 
-def filter_by_bsd_type(df: pd.DataFrame, selected_types: List[str]) -> pd.DataFrame:
+def filter_by_bsd_type(df: pd.DataFrame, selected_types: list[str]) -> pd.DataFrame:
     column = find_bsd_type_column(df.columns)
     if not column:
         return df
-    return df[df[column].astype(str).isin(selected_types)]
+    wanted = frozenset(selected_types)
+    values = df[column]
+    if pd.api.types.is_string_dtype(values.dtype):
+        mask = values.isin(wanted)
+    else:
+        mask = values.astype("category").isin(wanted)
+    return df.loc[mask]
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def parse_registry_bytes(data: bytes) -> pd.DataFrame:
+    return pd.read_excel(io.BytesIO(data), engine="calamine", dtype_backend="numpy_nullable")
+
+
+def load_registry_df(data: Optional[bytes]) -> Optional[pd.DataFrame]:
+    if not data:
+        return None
+    try:
+        return parse_registry_bytes(data)
+    except Exception:
+        return None
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def parse_registry_dates(data: Optional[bytes]) -> Optional[pd.Series]:
+    return registry_dates(load_registry_df(data))
+
+
+def registry_export_bytes(
+    payload: dict,
+    start_date: dt.date,
+    end_date: dt.date,
+    full_start: dt.date,
+    full_end: dt.date,
+) -> bytes:
+    file_bytes = payload.get("bytes") or b""
+    if start_date <= full_start and end_date >= full_end:
+        return file_bytes
+    df = load_registry_df(file_bytes)
+    filtered = filter_by_date(
+        df, parse_registry_dates(file_bytes), start_date, end_date, full_start, full_end
+    )
+    if filtered is None or len(filtered) == len(df):
+        return file_bytes
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        filtered.to_excel(writer, index=False, sheet_name="Registre")
+    # getvalue() returns the BytesIO's own buffer (no copy) while no view is
+    # exported; st.download_button rejects memoryviews such as getbuffer().
+    return buffer.getvalue()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_companies(token: str) -> list[CompanyAccess]:
+    with TrackdechetsClient(token) as client:
+        return client.list_my_companies()
+
+
+def fetch_registry(
+    client: TrackdechetsClient,
+    registry_type: str,
+    siret: str,
+    start_iso: str,
+    end_iso: str,
+    last_export: dict,
+) -> dict:
+    # Runs in a worker thread: no Streamlit calls here, failures are
+    # returned in the result and rendered by the script thread.
+    try:
+        export = client.generate_registry_export(
+            registry_type=registry_type,
+            siret=siret,
+            start_date=start_iso,
+            end_date=end_iso,
+        )
+    except requests.RequestException as exc:
+        return {"error": f"Erreur Trackdechets: {exc}"}
+    except TrackdechetsError as exc:
+        message = str(exc)
+        if "moins de 5 minutes" not in message:
+            return {"error": f"Erreur Trackdechets: {exc}"}
+        if not (
+            last_export.get("siret") == siret
+            and last_export.get("start") == start_iso
+            and last_export.get("end") == end_iso
+            and last_export.get("id")
+        ):
+            return {
+                "error": "Export deja genere il y a moins de 5 minutes. Attendez puis reessayez.",
+                "level": "warning",
+            }
+        try:
+            download_url = client.get_registry_export_download_url(last_export["id"])
+            file_bytes = client.download_file(download_url)
+        except (TrackdechetsError, requests.RequestException) as download_exc:
+            return {"error": f"Erreur Trackdechets: {download_exc}"}
+        return {
+            "bytes": file_bytes,
+            "export_id": last_export["id"],
+            "notice": "Export recent detecte. Fichier recupere.",
+        }
+
+    if not export.export_id:
+        return {"error": "Impossible de lancer l'export."}
+
+    status = export.status
+    start_time = time.time()
+    timeout_seconds = 180
+    delay = 1.0
+    while status not in {"SUCCESSFUL", "FAILED", "CANCELED"}:
+        if time.time() - start_time > timeout_seconds:
+            return {
+                "error": "L'export met trop de temps. Reessayez dans quelques minutes.",
+                "export_id": export.export_id,
+            }
+        time.sleep(delay)
+        delay = min(30.0, delay * 1.5)
+        try:
+            status = client.get_registry_export_status(export.export_id)
+        except (TrackdechetsError, requests.RequestException) as exc:
+            return {"error": f"Erreur Trackdechets: {exc}", "export_id": export.export_id}
+    if status in {"FAILED", "CANCELED"}:
+        return {"error": "L'export a echoue cote Trackdechets.", "export_id": export.export_id}
+    try:
+        download_url = client.get_registry_export_download_url(export.export_id)
+        file_bytes = client.download_file(download_url)
+    except (TrackdechetsError, requests.RequestException) as exc:
+        return {"error": f"Erreur Trackdechets: {exc}", "export_id": export.export_id}
+    return {"bytes": file_bytes, "export_id": export.export_id}
+
+
+def show_fetch_error(result: dict) -> None:
+    if result.get("level") == "warning":
+        st.warning(result["error"])
+    else:
+        st.error(result["error"])
 
 
 def require_password() -> bool:
@@ -93,62 +325,56 @@ def require_password() -> bool:
 
 
 def app_style() -> None:
-    st.markdown(
-        """
-        <style>
-          @import url('https://fonts.googleapis.com/css2?family=Source+Serif+4:wght@400;600&family=Source+Sans+3:wght@400;600&display=swap');
-          html, body, [class*="css"]  {
-            font-family: "Source Sans 3", "Segoe UI", "Arial", sans-serif;
-          }
-          h1, h2, h3, h4 {
-            font-family: "Source Serif 4", "Georgia", serif;
-          }
-          [data-testid="stHeader"], [data-testid="stToolbar"], footer {
-            visibility: hidden;
-            height: 0;
-          }
-          .block-container {
-            padding-top: 2.5rem;
-            padding-bottom: 2rem;
-          }
-          .hero {
-            background: linear-gradient(115deg, #f5f0ea 0%, #f8faf4 100%);
-            border: 1px solid #e6dfd7;
-            border-radius: 16px;
-            padding: 1.5rem 1.75rem;
-            margin-bottom: 1.5rem;
-          }
-          .hero small {
-            color: #6b5f55;
-            font-weight: 600;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-          }
-          .hero h1 {
-            margin-top: 0.5rem;
-            margin-bottom: 0.4rem;
-          }
-          .hero p {
-            margin: 0;
-            color: #4f463f;
-          }
-          .status-card {
-            background: #ffffff;
-            border-radius: 12px;
-            border: 1px solid #ece6df;
-            padding: 1rem 1.2rem;
-            margin-top: 0.8rem;
-          }
-        </style>
-        """,
-        unsafe_allow_html=True,
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+
+
+
+
+
+@st.fragment
+def _export_block(
+    incoming: dict,
+    outgoing: dict,
+    siret: str,
+    full_start: dt.date,
+    full_end: dt.date,
+) -> None:
+    st.subheader("Export")
+    export_start, export_end = st.date_input(
+        "Periode d'export",
+        value=(full_start, full_end),
+        format="DD/MM/YYYY",
     )
 
+    if export_start > export_end:
+        st.error("La date de debut doit preceder la date de fin.")
+        return
 
+    col_in_exp, col_out_exp = st.columns(2)
 
+    with col_in_exp:
+        filename = f"registre_entrant_{siret}_{export_start}_{export_end}.xlsx"
+        data = registry_export_bytes(incoming, export_start, export_end, full_start, full_end)
+        st.download_button(
+            label="Exporter registre entrant",
+            data=data,
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    with col_out_exp:
+        filename = f"registre_sortant_{siret}_{export_start}_{export_end}.xlsx"
+        data = registry_export_bytes(outgoing, export_start, export_end, full_start, full_end)
+        st.download_button(
+            label="Exporter registre sortant",
+            data=data,
+            file_name=filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
 
 
 def main() -> None:
+    today = dt.date.today()
     st.set_page_config(page_title="Export BSD", layout="centered")
     app_style()
 
@@ -171,10 +397,6 @@ def main() -> None:
         st.info("Renseignez le jeton pour continuer.")
         return
 
-    if "companies" not in st.session_state:
-        st.session_state.companies = []
-    if "companies_token" not in st.session_state:
-        st.session_state.companies_token = ""
     if "registry_cache" not in st.session_state:
         st.session_state.registry_cache = {}
     if "last_export_by_type" not in st.session_state:
@@ -183,22 +405,15 @@ def main() -> None:
     st.subheader("Etablissement")
     st.caption("Liste chargee automatiquement depuis votre jeton.")
 
-    if st.session_state.companies_token != token:
-        st.session_state.companies = []
-        st.session_state.registry_cache = {}
-        st.session_state.companies_token = token
-
-    if not st.session_state.companies:
-        client = TrackdechetsClient(token)
-        try:
-            st.session_state.companies = client.list_my_companies()
-        except TrackdechetsError as exc:
-            st.error(f"Erreur Trackdechets: {exc}")
-            return
+    try:
+        companies = _load_companies(token)
+    except TrackdechetsError as exc:
+        st.error(f"Erreur Trackdechets: {exc}")
+        return
 
     company_map = {
         f"{company.name} - {company.siret}": company.siret
-        for company in st.session_state.companies
+        for company in companies
     }
     company_options = list(company_map.keys())
     selected_company = st.selectbox(
@@ -215,127 +430,89 @@ def main() -> None:
         st.info("Selectionnez un etablissement pour continuer.")
         return
 
-    if len(siret) != 14 or not siret.isdigit():
+    if not _SIRET_RE.fullmatch(siret):
         st.error("Le SIRET doit contenir 14 chiffres.")
         return
 
-    client = TrackdechetsClient(token)
-
     full_start = DEFAULT_START_DATE
-    full_end = dt.date.today()
-    start_iso = to_iso_datetime(full_start, end_of_day=False)
+    full_end = today
+    start_iso = DEFAULT_START_ISO
     end_iso = to_iso_datetime(full_end, end_of_day=True)
     cache_prefix = f"{siret}|{start_iso}|{end_iso}"
 
-    def fetch_registry(registry_type: str) -> dict:
-        cache_key = f"{cache_prefix}|{registry_type}"
+    st.subheader("Registres")
+    registry_types = ("INCOMING", "OUTGOING")
+    cache_keys = {registry_type: f"{cache_prefix}|{registry_type}" for registry_type in registry_types}
+    pending = [
+        registry_type
+        for registry_type in registry_types
+        if cache_keys[registry_type] not in st.session_state.registry_cache
+    ]
+    results = {}
+    if pending:
+        with st.spinner("Preparation des registres sur Trackdechets..."):
+            with TrackdechetsClient(token) as client, ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    registry_type: executor.submit(
+                        fetch_registry,
+                        client,
+                        registry_type,
+                        siret,
+                        start_iso,
+                        end_iso,
+                        dict(st.session_state.last_export_by_type.get(registry_type, {})),
+                    )
+                    for registry_type in pending
+                }
+                for registry_type, future in futures.items():
+                    try:
+                        results[registry_type] = future.result()
+                    except Exception as exc:
+                        results[registry_type] = {"error": f"Erreur inattendue: {exc}"}
+
+    registries = {}
+    for registry_type in registry_types:
+        cache_key = cache_keys[registry_type]
         if cache_key in st.session_state.registry_cache:
-            return st.session_state.registry_cache[cache_key]
-
-        label = "entrant" if registry_type == "INCOMING" else "sortant"
-        file_bytes = None
-        reuse_download = False
-
-        with st.spinner(f"Preparation du registre {label}..."):
-            try:
-                export = client.generate_registry_export(
-                    registry_type=registry_type,
-                    siret=siret,
-                    start_date=start_iso,
-                    end_date=end_iso,
-                )
-            except TrackdechetsError as exc:
-                message = str(exc)
-                if "moins de 5 minutes" in message:
-                    last_export = st.session_state.last_export_by_type.get(registry_type, {})
-                    if (
-                        last_export.get("siret") == siret
-                        and last_export.get("start") == start_iso
-                        and last_export.get("end") == end_iso
-                        and last_export.get("id")
-                    ):
-                        st.info("Export recent detecte. Recuperation du fichier...")
-                        try:
-                            download_url = client.get_registry_export_download_url(last_export["id"])
-                            file_bytes = client.download_file(download_url)
-                            reuse_download = True
-                            export = type("Export", (), {"export_id": last_export["id"], "status": "SUCCESSFUL"})
-                        except TrackdechetsError as download_exc:
-                            st.error(f"Erreur Trackdechets: {download_exc}")
-                            return {"error": True}
-                    else:
-                        st.warning("Export deja genere il y a moins de 5 minutes. Attendez puis reessayez.")
-                        return {"error": True}
-                else:
-                    st.error(f"Erreur Trackdechets: {exc}")
-                    return {"error": True}
-
-        if not export.export_id:
-            st.error("Impossible de lancer l'export.")
-            return {"error": True}
-
-        st.session_state.last_export_by_type[registry_type] = {
-            "id": export.export_id,
-            "siret": siret,
-            "start": start_iso,
-            "end": end_iso,
-        }
-
-        if not reuse_download:
-            status_placeholder = st.empty()
-            status = export.status
-            start_time = time.time()
-            timeout_seconds = 180
-            while status not in {"SUCCESSFUL", "FAILED", "CANCELED"}:
-                if time.time() - start_time > timeout_seconds:
-                    st.error("L'export met trop de temps. Reessayez dans quelques minutes.")
-                    return {"error": True}
-                status_placeholder.info("Export en cours sur Trackdechets...")
-                time.sleep(5)
-                try:
-                    status = client.get_registry_export_status(export.export_id)
-                except TrackdechetsError as exc:
-                    st.error(f"Erreur Trackdechets: {exc}")
-                    return {"error": True}
-            if status in {"FAILED", "CANCELED"}:
-                st.error("L'export a echoue cote Trackdechets.")
-                return {"error": True}
-            try:
-                download_url = client.get_registry_export_download_url(export.export_id)
-                file_bytes = client.download_file(download_url)
-            except TrackdechetsError as exc:
-                st.error(f"Erreur Trackdechets: {exc}")
-                return {"error": True}
-
-        df = None
-        try:
-            df = pd.read_excel(io.BytesIO(file_bytes))
-        except Exception:
-            df = None
-
+            registries[registry_type] = st.session_state.registry_cache[cache_key]
+            continue
+        result = results[registry_type]
+        if result.get("export_id"):
+            st.session_state.last_export_by_type[registry_type] = {
+                "id": result["export_id"],
+                "siret": siret,
+                "start": start_iso,
+                "end": end_iso,
+            }
+        if result.get("error"):
+            registries[registry_type] = result
+            continue
+        if result.get("notice"):
+            st.info(result["notice"])
+        df = load_registry_df(result["bytes"])
         rows = len(df) if df is not None else 0
         payload = {
-            "bytes": file_bytes,
+            "bytes": result["bytes"],
             "rows": rows,
             "registry_type": registry_type,
-            "df": df,
         }
         st.session_state.registry_cache[cache_key] = payload
-        return payload
+        registries[registry_type] = payload
 
-    st.subheader("Registres")
+    incoming = registries["INCOMING"]
+    outgoing = registries["OUTGOING"]
     col_in, col_out = st.columns(2)
 
     with col_in:
-        incoming = fetch_registry("INCOMING")
         if incoming.get("error"):
+            show_fetch_error(incoming)
             st.error("Registre entrant indisponible.")
         else:
             st.metric("Registre entrant", incoming.get("rows", 0))
 
     with col_out:
-        outgoing = fetch_registry("OUTGOING")
         if outgoing.get("error"):
+            show_fetch_error(outgoing)
             st.error("Registre sortant indisponible.")
         else:
             st.metric("Registre sortant", outgoing.get("rows", 0))
@@ -343,73 +520,7 @@ def main() -> None:
     if incoming.get("error") or outgoing.get("error"):
         return
 
-    st.subheader("Export")
-    export_start, export_end = st.date_input(
-        "Periode d'export",
-        value=(full_start, full_end),
-        format="DD/MM/YYYY",
-    )
-
-    if export_start > export_end:
-        st.error("La date de debut doit preceder la date de fin.")
-        return
-
-    def filter_by_date(df: pd.DataFrame, start_date: dt.date, end_date: dt.date) -> pd.DataFrame:
-        if df is None or df.empty:
-            return df
-        candidates = [
-            "date",
-            "date de creation",
-            "date de reception",
-            "date de prise en charge",
-            "date d'envoi",
-            "date d'emission",
-            "createdat",
-            "date creation",
-        ]
-        normalized = {col.strip().lower(): col for col in df.columns}
-        date_col = None
-        for candidate in candidates:
-            if candidate in normalized:
-                date_col = normalized[candidate]
-                break
-        if not date_col:
-            return df
-        series = pd.to_datetime(df[date_col], errors="coerce")
-        mask = (series.dt.date >= start_date) & (series.dt.date <= end_date)
-        return df.loc[mask]
-
-    col_in_exp, col_out_exp = st.columns(2)
-
-    with col_in_exp:
-        df_in = incoming.get("df")
-        filtered_in = filter_by_date(df_in, export_start, export_end)
-        filename = f"registre_entrant_{siret}_{export_start}_{export_end}.xlsx"
-        buffer = io.BytesIO()
-        if filtered_in is not None:
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                filtered_in.to_excel(writer, index=False, sheet_name="Registre")
-        st.download_button(
-            label="Exporter registre entrant",
-            data=buffer.getvalue(),
-            file_name=filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-
-    with col_out_exp:
-        df_out = outgoing.get("df")
-        filtered_out = filter_by_date(df_out, export_start, export_end)
-        filename = f"registre_sortant_{siret}_{export_start}_{export_end}.xlsx"
-        buffer = io.BytesIO()
-        if filtered_out is not None:
-            with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-                filtered_out.to_excel(writer, index=False, sheet_name="Registre")
-        st.download_button(
-            label="Exporter registre sortant",
-            data=buffer.getvalue(),
-            file_name=filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
+    _export_block(incoming, outgoing, siret, full_start, full_end)
 
 
 if __name__ == "__main__":
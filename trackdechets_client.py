@@ -1,19 +1,158 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import io
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, FrozenSet, List, Optional, Tuple
 
+import httpx
+import orjson
 import requests
+from cachetools import Cache, LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 GRAPHQL_ENDPOINT = "https://api.trackdechets.beta.gouv.fr"
 
+TERMINAL_EXPORT_STATUSES = frozenset({"SUCCESSFUL", "FAILED", "CANCELED"})
+
+
+def _minify(query: str) -> str:
+    return " ".join(query.split())
+
+
+_Q_COMPANY_INFOS = _minify(
+    """
+    query CompanyInfos($siret: String!) {
+      companyInfos(siret: $siret) {
+        name
+        address
+        siret
+        isRegistered
+      }
+    }
+    """
+)
+
+_Q_SEARCH_COMPANIES = _minify(
+    """
+    query SearchCompanies($clue: String!) {
+      searchCompanies(clue: $clue) {
+        name
+        siret
+        etatAdministratif
+      }
+    }
+    """
+)
+
+_Q_RESOLVE_SIRET = _minify(
+    """
+    query ResolveSiret($siret: String!) {
+      infos: companyInfos(siret: $siret) {
+        name
+        address
+        siret
+        isRegistered
+      }
+      search: searchCompanies(clue: $siret) {
+        name
+        siret
+        etatAdministratif
+      }
+    }
+    """
+)
+
+_Q_MY_COMPANIES = _minify(
+    """
+    query MyCompanies {
+      me {
+        companies {
+          name
+          siret
+        }
+      }
+    }
+    """
+)
+
+_Q_GENERATE_REGISTRY_EXPORT = _minify(
+    """
+    mutation GenerateRegistryV2Export(
+      $registryType: RegistryV2ExportType!,
+      $format: RegistryExportFormat!,
+      $siret: String!,
+      $dateRange: DateFilter!
+    ) {
+      generateRegistryV2Export(
+        registryType: $registryType,
+        format: $format,
+        siret: $siret,
+        dateRange: $dateRange
+      ) {
+        id
+        status
+      }
+    }
+    """
+)
+
+_Q_REGISTRY_EXPORT_STATUS = _minify(
+    """
+    query RegistryV2Export($id: ID!) {
+      registryV2Export(id: $id) {
+        id
+        status
+      }
+    }
+    """
+)
+
+_Q_REGISTRY_EXPORT_DOWNLOAD_URL = _minify(
+    """
+    query RegistryV2ExportDownloadSignedUrl($exportId: String!) {
+      registryV2ExportDownloadSignedUrl(exportId: $exportId) {
+        signedUrl
+      }
+    }
+    """
+)
+
+
+# The DateFilter input has used both {gte, lte} and {_gte, _lte}; the shape
+# accepted by an endpoint is remembered after the first successful export.
+# Once it is known, its error is the one reported if every shape fails.
+_DATE_RANGE_KEYS: Tuple[Tuple[str, str], ...] = (("gte", "lte"), ("_gte", "_lte"))
+_DATE_RANGE_KEYS_BY_ENDPOINT: Dict[str, Tuple[str, str]] = {}
+
+_MISSING = object()
+
+_QUERIES = {
+    "CompanyInfos": _Q_COMPANY_INFOS,
+    "SearchCompanies": _Q_SEARCH_COMPANIES,
+    "ResolveSiret": _Q_RESOLVE_SIRET,
+    "MyCompanies": _Q_MY_COMPANIES,
+    "GenerateRegistryV2Export": _Q_GENERATE_REGISTRY_EXPORT,
+    "RegistryV2Export": _Q_REGISTRY_EXPORT_STATUS,
+    "RegistryV2ExportDownloadSignedUrl": _Q_REGISTRY_EXPORT_DOWNLOAD_URL,
+}
+
+# Each request body is this prefix, the JSON-encoded variables, then "}".
+_PAYLOAD_PREFIX: Dict[str, bytes] = {
+    name: orjson.dumps({"query": query})[:-1] + b',"variables":'
+    for name, query in _QUERIES.items()
+}
+
 
 class TrackdechetsError(RuntimeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompanyInfo:
     name: str
     address: str
@@ -21,129 +160,264 @@ class CompanyInfo:
     is_registered: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompanySearchResult:
     name: str
     siret: str
     etat_administratif: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RegistryExport:
     export_id: str
     status: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompanyAccess:
     name: str
     siret: str
 
 
+def _base_headers(token: str) -> Dict[str, str]:
+    # API headers only: downloads from signed URLs, which carry their own
+    # credentials, strip these so the token never leaves the API.
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+def _snippet(response: Any) -> str:
+    # Only decode the head of the body: error pages can be megabytes long.
+    content = response.content
+    raw = content[:2048]
+    snippet = raw.decode(response.encoding or "utf-8", errors="replace").strip()
+    if len(snippet) > 500 or len(content) > len(raw):
+        snippet = snippet[:500] + "..."
+    return snippet
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedResponse:
+    etag: Optional[str]
+    digest: bytes
+    data: Dict[str, Any]
+
+
+def _revalidation_headers(cached: Any) -> Optional[Dict[str, str]]:
+    if cached is _MISSING or not cached.etag:
+        return None
+    return {"If-None-Match": cached.etag}
+
+
+def _body_digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _graphql_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    errors = data.get("errors")
+    if errors:
+        if len(errors) == 1:
+            raise TrackdechetsError(errors[0].get("message", "Unknown error"))
+        raise TrackdechetsError("; ".join([error.get("message", "Unknown error") for error in errors]))
+    return data.get("data", {})
+
+
+def _request_body(query_name: str, variables: Dict[str, Any]) -> Tuple[bytes, Tuple[str, bytes]]:
+    encoded = orjson.dumps(variables, option=orjson.OPT_SORT_KEYS)
+    return _PAYLOAD_PREFIX[query_name] + encoded + b"}", (query_name, encoded)
+
+
+def _graphql_response(
+    response: Any, reason: str, cached: Any, revalidate: bool
+) -> Tuple[Dict[str, Any], Optional[_CachedResponse]]:
+    if cached is not _MISSING and response.status_code == 304:
+        return cached.data, None
+    if response.status_code >= 400:
+        snippet = _snippet(response)
+        raise TrackdechetsError(f"HTTP error: {response.status_code} {reason} | body={snippet}")
+
+    digest = _body_digest(response.content) if revalidate else b""
+    if cached is not _MISSING and cached.digest == digest:
+        return cached.data, None
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as exc:
+        snippet = _snippet(response)
+        raise TrackdechetsError(f"Réponse non-JSON: {snippet}") from exc
+    data = _graphql_data(data)
+    if not revalidate:
+        return data, None
+    return data, _CachedResponse(response.headers.get("ETag"), digest, data)
+
+
+def _company_info_from_dict(info: Optional[Dict[str, Any]], siret: str) -> Optional[CompanyInfo]:
+    if not info:
+        return None
+    return CompanyInfo(
+        name=info.get("name") or "",
+        address=info.get("address") or "",
+        siret=info.get("siret") or siret,
+        is_registered=info.get("isRegistered"),
+    )
+
+
+def _search_result_from_dict(
+    companies: Optional[List[Dict[str, Any]]], siret: str
+) -> Optional[CompanySearchResult]:
+    match = next((company for company in companies or [] if company.get("siret") == siret), None)
+    if match is None:
+        return None
+    return CompanySearchResult(
+        name=match.get("name") or "",
+        siret=match.get("siret") or "",
+        etat_administratif=match.get("etatAdministratif"),
+    )
+
+
+def _company_accesses_from_dict(data: Dict[str, Any]) -> List[CompanyAccess]:
+    me = data.get("me") or {}
+    companies = me.get("companies") or []
+    decorated: List[Tuple[str, str, str]] = []
+    for company in companies:
+        siret = company.get("siret") or ""
+        if not siret:
+            continue
+        name = company.get("name") or ""
+        decorated.append((name.lower(), siret, name))
+    decorated.sort()
+    return [CompanyAccess(name=name, siret=siret) for _, siret, name in decorated]
+
+
+def _date_range_key_order() -> List[Tuple[str, str]]:
+    known = _DATE_RANGE_KEYS_BY_ENDPOINT.get(GRAPHQL_ENDPOINT)
+    if not known:
+        return list(_DATE_RANGE_KEYS)
+    return [known] + [keys for keys in _DATE_RANGE_KEYS if keys != known]
+
+
+def _registry_export_variables(
+    registry_type: str,
+    siret: str,
+    start_date: str,
+    end_date: str,
+    format_: str,
+    date_range_keys: Tuple[str, str],
+) -> Dict[str, Any]:
+    start_key, end_key = date_range_keys
+    return {
+        "registryType": registry_type,
+        "format": format_,
+        "siret": siret,
+        "dateRange": {start_key: start_date, end_key: end_date},
+    }
+
+
+def _registry_export_from_dict(data: Dict[str, Any]) -> RegistryExport:
+    export = data.get("generateRegistryV2Export") or {}
+    return RegistryExport(export_id=export.get("id", ""), status=export.get("status", ""))
+
+
 class TrackdechetsClient:
     def __init__(self, token: str) -> None:
         self._token = token.strip()
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # A GraphQL POST that reached the server may already have run (a 502
+        # can follow a created export): only retry failed connections.
+        api_retry = retry.new(allowed_methods=frozenset(["GET"]))
+        api_adapter = HTTPAdapter(pool_maxsize=16, max_retries=api_retry)
+        self._session.mount(GRAPHQL_ENDPOINT + "/", api_adapter)
+        self._base_headers = _base_headers(self._token)
+        self._session.headers.update(self._base_headers)
+        self._company_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        self._companies_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+        self._response_cache: LRUCache = LRUCache(maxsize=256)
+        self._cache_lock = threading.Lock()
 
-    def _post(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
-        payload = {"query": query, "variables": variables}
-        response = requests.post(GRAPHQL_ENDPOINT, json=payload, headers=headers, timeout=60)
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            snippet = response.text.strip()
-            if len(snippet) > 500:
-                snippet = snippet[:500] + "..."
-            raise TrackdechetsError(
-                f"HTTP error: {exc} | status={response.status_code} | body={snippet}"
-            ) from exc
+    def close(self) -> None:
+        self._session.close()
 
-        try:
-            data = response.json()
-        except ValueError as exc:
-            snippet = response.text.strip()
-            if len(snippet) > 500:
-                snippet = snippet[:500] + "..."
-            raise TrackdechetsError(f"Réponse non-JSON: {snippet}") from exc
-        if "errors" in data and data["errors"]:
-            messages = "; ".join(error.get("message", "Unknown error") for error in data["errors"])
-            raise TrackdechetsError(messages)
-
-        return data.get("data", {})
+    def __enter__(self) -> TrackdechetsClient:
+        return self
 
-    def company_infos(self, siret: str) -> Optional[CompanyInfo]:
-        query = """
-        query CompanyInfos($siret: String!) {
-          companyInfos(siret: $siret) {
-            name
-            address
-            siret
-            isRegistered
-          }
-        }
-        """
-        data = self._post(query, {"siret": siret})
-        info = data.get("companyInfos")
-        if not info:
-            return None
-        return CompanyInfo(
-            name=info.get("name") or "",
-            address=info.get("address") or "",
-            siret=info.get("siret") or siret,
-            is_registered=info.get("isRegistered"),
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cache_get(self, cache: Cache, key: Any) -> Any:
+        with self._cache_lock:
+            return cache.get(key, _MISSING)
+
+    def _cache_set(self, cache: Cache, key: Any, value: Any) -> None:
+        with self._cache_lock:
+            cache[key] = value
+
+    def _post(
+        self, query_name: str, variables: Dict[str, Any], revalidate: bool = False
+    ) -> Dict[str, Any]:
+        body, key = _request_body(query_name, variables)
+        cached = self._cache_get(self._response_cache, key) if revalidate else _MISSING
+        response = self._session.post(
+            GRAPHQL_ENDPOINT, data=body, headers=_revalidation_headers(cached), timeout=60
         )
+        data, entry = _graphql_response(response, response.reason, cached, revalidate)
+        if entry is not None:
+            self._cache_set(self._response_cache, key, entry)
+        return data
+
+    def company_infos(self, siret: str) -> Optional[CompanyInfo]:
+        key = ("infos", siret)
+        cached = self._cache_get(self._company_cache, key)
+        if cached is not _MISSING:
+            return cached
+        data = self._post("CompanyInfos", {"siret": siret}, revalidate=True)
+        info = _company_info_from_dict(data.get("companyInfos"), siret)
+        self._cache_set(self._company_cache, key, info)
+        return info
 
     def search_company(self, siret: str) -> Optional[CompanySearchResult]:
-        query = """
-        query SearchCompanies($clue: String!) {
-          searchCompanies(clue: $clue) {
-            name
-            siret
-            etatAdministratif
-          }
-        }
-        """
-        data = self._post(query, {"clue": siret})
-        companies = data.get("searchCompanies") or []
-        for company in companies:
-            if company.get("siret") == siret:
-                return CompanySearchResult(
-                    name=company.get("name") or "",
-                    siret=company.get("siret") or "",
-                    etat_administratif=company.get("etatAdministratif"),
-                )
-        return None
+        key = ("search", siret)
+        cached = self._cache_get(self._company_cache, key)
+        if cached is not _MISSING:
+            return cached
+        data = self._post("SearchCompanies", {"clue": siret})
+        result = _search_result_from_dict(data.get("searchCompanies"), siret)
+        self._cache_set(self._company_cache, key, result)
+        return result
+
+    def resolve_siret(
+        self, siret: str
+    ) -> Tuple[Optional[CompanyInfo], Optional[CompanySearchResult]]:
+        info = self._cache_get(self._company_cache, ("infos", siret))
+        result = self._cache_get(self._company_cache, ("search", siret))
+        if info is not _MISSING and result is not _MISSING:
+            return info, result
+        data = self._post("ResolveSiret", {"siret": siret})
+        info = _company_info_from_dict(data.get("infos"), siret)
+        result = _search_result_from_dict(data.get("search"), siret)
+        self._cache_set(self._company_cache, ("infos", siret), info)
+        self._cache_set(self._company_cache, ("search", siret), result)
+        return info, result
 
     def list_my_companies(self) -> List[CompanyAccess]:
-        query = """
-        query MyCompanies {
-          me {
-            companies {
-              name
-              siret
-            }
-          }
-        }
-        """
-        data = self._post(query, {})
-        me = data.get("me") or {}
-        companies = me.get("companies") or []
-        results: List[CompanyAccess] = []
-        for company in companies:
-            siret = company.get("siret") or ""
-            if not siret:
-                continue
-            results.append(
-                CompanyAccess(
-                    name=company.get("name") or "",
-                    siret=siret,
-                )
-            )
-        results.sort(key=lambda item: (item.name.lower(), item.siret))
-        return results
+        cached = self._cache_get(self._companies_cache, "me")
+        if cached is not _MISSING:
+            return list(cached)
+        data = self._post("MyCompanies", {}, revalidate=True)
+        companies = _company_accesses_from_dict(data)
+        self._cache_set(self._companies_cache, "me", companies)
+        return list(companies)
 
     def generate_registry_export(
         self,
@@ -153,76 +427,251 @@ class TrackdechetsClient:
         end_date: str,
         format_: str = "XLSX",
     ) -> RegistryExport:
-        mutation = """
-        mutation GenerateRegistryV2Export(
-          $registryType: RegistryV2ExportType!,
-          $format: RegistryExportFormat!,
-          $siret: String!,
-          $dateRange: DateFilter!
-        ) {
-          generateRegistryV2Export(
-            registryType: $registryType,
-            format: $format,
-            siret: $siret,
-            dateRange: $dateRange
-          ) {
-            id
-            status
-          }
-        }
-        """
-        variants = [
-            {"gte": start_date, "lte": end_date},
-            {"_gte": start_date, "_lte": end_date},
-        ]
+        known = _DATE_RANGE_KEYS_BY_ENDPOINT.get(GRAPHQL_ENDPOINT)
         last_error: Optional[Exception] = None
-        for date_range in variants:
-            variables = {
-                "registryType": registry_type,
-                "format": format_,
-                "siret": siret,
-                "dateRange": date_range,
-            }
+        for date_range_keys in _date_range_key_order():
+            variables = _registry_export_variables(
+                registry_type, siret, start_date, end_date, format_, date_range_keys
+            )
             try:
-                data = self._post(mutation, variables)
+                data = self._post("GenerateRegistryV2Export", variables)
             except TrackdechetsError as exc:
-                last_error = exc
+                if last_error is None or not known:
+                    last_error = exc
                 continue
-            export = data.get("generateRegistryV2Export") or {}
-            return RegistryExport(export_id=export.get("id", ""), status=export.get("status", ""))
+            _DATE_RANGE_KEYS_BY_ENDPOINT[GRAPHQL_ENDPOINT] = date_range_keys
+            return _registry_export_from_dict(data)
         if last_error:
             raise last_error
         raise TrackdechetsError("Impossible de lancer l'export.")
 
     def get_registry_export_status(self, export_id: str) -> str:
-        query = """
-        query RegistryV2Export($id: ID!) {
-          registryV2Export(id: $id) {
-            id
-            status
-          }
-        }
-        """
-        data = self._post(query, {"id": export_id})
+        data = self._post("RegistryV2Export", {"id": export_id})
         export = data.get("registryV2Export") or {}
         return export.get("status", "")
 
     def get_registry_export_download_url(self, export_id: str) -> str:
-        query = """
-        query RegistryV2ExportDownloadSignedUrl($exportId: String!) {
-          registryV2ExportDownloadSignedUrl(exportId: $exportId) {
-            signedUrl
-          }
-        }
-        """
-        data = self._post(query, {"exportId": export_id})
+        data = self._post("RegistryV2ExportDownloadSignedUrl", {"exportId": export_id})
         payload = data.get("registryV2ExportDownloadSignedUrl") or {}
         return payload.get("signedUrl", "")
 
+    def wait_for_exports(
+        self,
+        export_ids: List[str],
+        terminal: FrozenSet[str] = TERMINAL_EXPORT_STATUSES,
+        poll_interval: float = 5.0,
+        timeout: float = 180.0,
+    ) -> Dict[str, str]:
+        async def wait() -> Dict[str, str]:
+            async with AsyncTrackdechetsClient(self._token) as client:
+                return await client.wait_for_exports(export_ids, terminal, poll_interval, timeout)
+
+        return asyncio.run(wait())
+
+    def download_file_to(self, url: str, fp: BinaryIO, chunk_size: int = 1 << 16) -> int:
+        with self._session.get(
+            url,
+            headers=dict.fromkeys(self._base_headers),
+            timeout=120,
+            stream=True,
+        ) as response:
+            if response.status_code >= 400:
+                raise TrackdechetsError(
+                    f"Download error: {response.status_code} {response.reason}"
+                )
+            total = 0
+            for chunk in response.iter_content(chunk_size):
+                fp.write(chunk)
+                total += len(chunk)
+        return total
+
     def download_file(self, url: str) -> bytes:
-        response = requests.get(url, timeout=120)
+        buffer = io.BytesIO()
+        self.download_file_to(url, buffer)
+        return buffer.getvalue()
+
+
+class AsyncTrackdechetsClient:
+    def __init__(self, token: str) -> None:
+        self._token = token.strip()
+        self._base_headers = _base_headers(self._token)
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=60,
+            headers=self._base_headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        self._company_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        self._companies_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+        self._response_cache: LRUCache = LRUCache(maxsize=256)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncTrackdechetsClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _post(
+        self, query_name: str, variables: Dict[str, Any], revalidate: bool = False
+    ) -> Dict[str, Any]:
+        body, key = _request_body(query_name, variables)
+        cached = self._response_cache.get(key, _MISSING) if revalidate else _MISSING
+        response = await self._client.post(
+            GRAPHQL_ENDPOINT, content=body, headers=_revalidation_headers(cached)
+        )
+        data, entry = _graphql_response(response, response.reason_phrase, cached, revalidate)
+        if entry is not None:
+            self._response_cache[key] = entry
+        return data
+
+    async def company_infos(self, siret: str) -> Optional[CompanyInfo]:
+        key = ("infos", siret)
+        cached = self._company_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        data = await self._post("CompanyInfos", {"siret": siret}, revalidate=True)
+        info = _company_info_from_dict(data.get("companyInfos"), siret)
+        self._company_cache[key] = info
+        return info
+
+    async def search_company(self, siret: str) -> Optional[CompanySearchResult]:
+        key = ("search", siret)
+        cached = self._company_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        data = await self._post("SearchCompanies", {"clue": siret})
+        result = _search_result_from_dict(data.get("searchCompanies"), siret)
+        self._company_cache[key] = result
+        return result
+
+    async def resolve_siret(
+        self, siret: str
+    ) -> Tuple[Optional[CompanyInfo], Optional[CompanySearchResult]]:
+        info = self._company_cache.get(("infos", siret), _MISSING)
+        result = self._company_cache.get(("search", siret), _MISSING)
+        if info is not _MISSING and result is not _MISSING:
+            return info, result
+        data = await self._post("ResolveSiret", {"siret": siret})
+        info = _company_info_from_dict(data.get("infos"), siret)
+        result = _search_result_from_dict(data.get("search"), siret)
+        self._company_cache[("infos", siret)] = info
+        self._company_cache[("search", siret)] = result
+        return info, result
+
+    async def list_my_companies(self) -> List[CompanyAccess]:
+        cached = self._companies_cache.get("me", _MISSING)
+        if cached is not _MISSING:
+            return list(cached)
+        data = await self._post("MyCompanies", {}, revalidate=True)
+        companies = _company_accesses_from_dict(data)
+        self._companies_cache["me"] = companies
+        return list(companies)
+
+    async def generate_registry_export(
+        self,
+        registry_type: str,
+        siret: str,
+        start_date: str,
+        end_date: str,
+        format_: str = "XLSX",
+    ) -> RegistryExport:
+        key_order = _date_range_key_order()
+        known_error: Optional[Exception] = None
+        if GRAPHQL_ENDPOINT in _DATE_RANGE_KEYS_BY_ENDPOINT:
+            known, *key_order = key_order
+            variables = _registry_export_variables(
+                registry_type, siret, start_date, end_date, format_, known
+            )
+            try:
+                data = await self._post("GenerateRegistryV2Export", variables)
+            except TrackdechetsError as exc:
+                known_error = exc
+            else:
+                return _registry_export_from_dict(data)
+
+        # Only the date range shape matching the schema passes validation, so
+        # the remaining shapes can be sent at once without creating two exports.
+        results = await asyncio.gather(
+            *(
+                self._post(
+                    "GenerateRegistryV2Export",
+                    _registry_export_variables(
+                        registry_type, siret, start_date, end_date, format_, date_range_keys
+                    ),
+                )
+                for date_range_keys in key_order
+            ),
+            return_exceptions=True,
+        )
+        last_error: Optional[Exception] = None
+        for date_range_keys, result in zip(key_order, results):
+            if isinstance(result, TrackdechetsError):
+                last_error = result
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            _DATE_RANGE_KEYS_BY_ENDPOINT[GRAPHQL_ENDPOINT] = date_range_keys
+            return _registry_export_from_dict(result)
+        if known_error or last_error:
+            raise known_error or last_error
+        raise TrackdechetsError("Impossible de lancer l'export.")
+
+    async def get_registry_export_status(self, export_id: str) -> str:
+        data = await self._post("RegistryV2Export", {"id": export_id})
+        export = data.get("registryV2Export") or {}
+        return export.get("status", "")
+
+    async def get_registry_export_download_url(self, export_id: str) -> str:
+        data = await self._post("RegistryV2ExportDownloadSignedUrl", {"exportId": export_id})
+        payload = data.get("registryV2ExportDownloadSignedUrl") or {}
+        return payload.get("signedUrl", "")
+
+    async def wait_for_exports(
+        self,
+        export_ids: List[str],
+        terminal: FrozenSet[str] = TERMINAL_EXPORT_STATUSES,
+        poll_interval: float = 5.0,
+        timeout: float = 180.0,
+    ) -> Dict[str, str]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        statuses: Dict[str, str] = {}
+        pending = list(dict.fromkeys(export_ids))
+        while pending:
+            results = await asyncio.gather(
+                *(self.get_registry_export_status(export_id) for export_id in pending)
+            )
+            statuses.update(zip(pending, results))
+            pending = [export_id for export_id in pending if statuses[export_id] not in terminal]
+            if not pending:
+                break
+            if loop.time() + poll_interval > deadline:
+                raise TrackdechetsError(f"Exports toujours en cours: {', '.join(pending)}")
+            await asyncio.sleep(poll_interval)
+        return statuses
+
+    async def download_file_to(self, url: str, fp: BinaryIO, chunk_size: int = 1 << 16) -> int:
+        request = self._client.build_request("GET", url, timeout=120)
+        for header in self._base_headers:
+            request.headers.pop(header, None)
+        response = await self._client.send(request, stream=True)
         try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise TrackdechetsError(f"Download error: {exc}") from exc
-        return response.content
+            if response.status_code >= 400:
+                raise TrackdechetsError(
+                    f"Download error: {response.status_code} {response.reason_phrase}"
+                )
+            total = 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                fp.write(chunk)
+                total += len(chunk)
+        finally:
+            await response.aclose()
+        return total
+
+    async def download_file(self, url: str) -> bytes:
+        buffer = io.BytesIO()
+        await self.download_file_to(url, buffer)
+        return buffer.getvalue()